@@ -1,32 +1,68 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import List, Optional, Literal
-import os, re
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Iterator, List, Optional, Literal
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import reduce
+from operator import add, attrgetter
+import hashlib, os, re
+import numpy as np
+import orjson
 
 app = FastAPI(title="Payroll Analyzer API+UI", docs_url="/docs", redoc_url=None)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        resp: Response = await call_next(request)
-        resp.headers["Content-Security-Policy"] = "default-src 'self'; img-src 'self' data:; style-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; base-uri 'none'; frame-ancestors 'none'"
-        resp.headers["X-Content-Type-Options"] = "nosniff"
-        resp.headers["X-Frame-Options"] = "DENY"
-        resp.headers["Referrer-Policy"] = "no-referrer"
-        resp.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        return resp
+# Pre-encoded once; ASGI header names are lowercase bytes
+_SECURITY_HEADERS = (
+    (b"content-security-policy", b"default-src 'self'; img-src 'self' data:; style-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; base-uri 'none'; frame-ancestors 'none'"),
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"no-referrer"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+)
+_SECURITY_HEADER_NAMES = frozenset(k for k, _ in _SECURITY_HEADERS)
+
+class SecurityHeadersMiddleware:
+    # Plain ASGI middleware: BaseHTTPMiddleware would wrap every request in a task group and memory stream
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                # Drop any value the app already set so ours replaces it rather than duplicating
+                headers = [h for h in message.get("headers", ()) if h[0] not in _SECURITY_HEADER_NAMES]
+                headers.extend(_SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 app.add_middleware(SecurityHeadersMiddleware)
 
 static_dir = os.path.join(os.path.dirname(__file__), "static")
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+# Landing page is static; read it once at startup instead of on every hit
+with open(os.path.join(static_dir, "index.html"), "rb") as f:
+    _INDEX_HTML = f.read()
+# Not "immutable": "/" keeps its URL across deploys, so browsers revalidate with the ETag after an hour
+_INDEX_ETAG = f'"{hashlib.sha1(_INDEX_HTML).hexdigest()}"'
+_INDEX_CACHE_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=3600"}
+
 @app.get("/", response_class=HTMLResponse)
-async def index():
-    with open(os.path.join(static_dir, "index.html"), "r", encoding="utf-8") as f:
-        return HTMLResponse(f.read())
+async def index(request: Request):
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if _INDEX_ETAG in tags or "*" in tags:
+            return Response(status_code=304, headers=_INDEX_CACHE_HEADERS)
+    return HTMLResponse(_INDEX_HTML, headers=_INDEX_CACHE_HEADERS)
 
 @app.get("/api/health")
 async def health():
@@ -77,74 +113,149 @@ class AnalyzeOut(BaseModel):
     fullData: List[dict]
 
 # --------------- Helpers -----------------
+# Patterns used by parse_text, compiled once at import time
+_EMRI_RE = re.compile(r"Emri i Tatimpaguesit:\s*([\w\s]+?)\s*3\)")
+_MUAJI_RE = re.compile(r"Muaji:\s*(\w+)")
+# Each person starts with: [nr rendor] [10-char id] then content until next such pattern or "Totali i Listepageses".
+# Headers and block ends are located separately so scanning stays linear (no lazy .*? + lookahead backtracking).
+_HEADER_RE = re.compile(r"(?<!\d)(\d+)\s+(\w{10})\s+")
+_BLOCK_END_RE = re.compile(r"(?=\s\d+\s+\w{10}\s+|\s+Totali i Listepageses)", re.IGNORECASE)
+
 def safe_float(val: str) -> float:
+    if not val:
+        return 0.0
     try:
         return float(val.replace(",", ""))
-    except:
+    except ValueError:
         return 0.0
 
+def _num_at(numbers: list[str], idx: int) -> float:
+    # Guard against short lines
+    if idx < len(numbers):
+        return safe_float(numbers[idx])
+    return 0.0
+
+def _person_blocks(cleaned: str) -> Iterator[tuple[str, str]]:
+    # Yields (id, datablock) exactly like finditer over the old single person regex:
+    # a header only counts if some block end follows it, and scanning resumes at that end.
+    ends = [m.start() for m in _BLOCK_END_RE.finditer(cleaned)]
+    pos = 0
+    while True:
+        header = _HEADER_RE.search(cleaned, pos)
+        if header is None:
+            return
+        i = bisect_left(ends, header.end())
+        if i == len(ends):
+            return
+        pos = ends[i]
+        yield header.group(2), cleaned[header.end():pos]
+
 def parse_text(t: str) -> tuple[Meta, list[Person]]:
-    text = t or ""
-    emri_m = re.search(r"Emri i Tatimpaguesit:\s*([\w\s]+?)\s*3\)", text)
-    muaji_m = re.search(r"Muaji:\s*(\w+)", text)
-    meta = Meta(
+    # Collapse all whitespace (incl. line breaks) into single spaces in one pass
+    cleaned = " ".join((t or "").split())
+    emri_m = _EMRI_RE.search(cleaned)
+    muaji_m = _MUAJI_RE.search(cleaned)
+    meta = Meta.model_construct(
         emri=emri_m.group(1).strip() if emri_m else "Subjekti i Panjohur",
         muaji=muaji_m.group(1).strip() if muaji_m else "Muaji i Panjohur"
     )
-    cleaned = re.sub(r"(\r\n|\n|\r)", " ", text)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
 
-    # Each person starts with: [nr rendor] [10-char id] then content until next such pattern or "Totali i Listepageses"
-    person_regex = re.compile(r"(\d+)\s+(\w{10})\s+(.*?)(?=\s\d+\s+\w{10}\s+|\s+Totali i Listepageses)", re.IGNORECASE)
     people: list[Person] = []
-    for m in person_regex.finditer(cleaned):
-        pid = m.group(2).strip()
-        datablock = m.group(3).strip()
+    for pid, datablock in _person_blocks(cleaned):
+        datablock = datablock.strip()
         parts = datablock.split()
-        name_parts, numbers, found_first_num = [], [], False
-        for part in parts:
-            if not found_first_num and re.match(r"^\d", part):
-                found_first_num = True
-            if found_first_num:
-                numbers.append(part)
-            else:
-                name_parts.append(part)
-        name = " ".join(name_parts).strip()
+        # Name runs up to the first token starting with a digit; the rest are numeric fields
+        split_at = next((i for i, part in enumerate(parts) if part[0].isdecimal()), len(parts))
+        name = " ".join(parts[:split_at])
+        numbers = parts[split_at:]
         # Expect at least ~19 numeric fields as në JS
-        # Guard against short lines
-        def num_at(idx):
-            if idx < len(numbers):
-                return safe_float(numbers[idx])
-            return 0.0
-
-        p = Person(
+        # Values are already coerced to str/float above, so skip pydantic validation
+        p = Person.model_construct(
             id=pid,
             emri=name or pid,
-            pagaBruto=num_at(4),
-            kontrShoqTotal=num_at(8),
-            kontrSuplTotal=num_at(11),
-            kontrShoqDhenes=num_at(6),
-            kontrShoqMarres=num_at(7),
-            kontrSuplDhenes=num_at(9),
-            kontrSuplMarres=num_at(10),
-            kontrShendetTotal=num_at(14),
-            pensionVullnetar=num_at(15),
-            tap=num_at(18),
+            pagaBruto=_num_at(numbers, 4),
+            kontrShoqTotal=_num_at(numbers, 8),
+            kontrSuplTotal=_num_at(numbers, 11),
+            kontrShoqDhenes=_num_at(numbers, 6),
+            kontrShoqMarres=_num_at(numbers, 7),
+            kontrSuplDhenes=_num_at(numbers, 9),
+            kontrSuplMarres=_num_at(numbers, 10),
+            kontrShendetTotal=_num_at(numbers, 14),
+            pensionVullnetar=_num_at(numbers, 15),
+            tap=_num_at(numbers, 18),
         )
         # Heuristic from JS: if PF owner row with 0 bruto and 9200 social, set 40000
         if p.pagaBruto == 0 and p.kontrShoqTotal == 9200:
-            p.pagaBruto = 40000
+            p.pagaBruto = 40000.0
         people.append(p)
     return meta, people
 
+# English grouping (',' thousands, '.' decimals) rather than the sq-AL locale the old UI used.
+def _fmt0(x: float) -> str:
+    return format(x, ",.0f")
+
+def _fmt2(x: float) -> str:
+    return format(x, ",.2f")
+
 def fmt_num(x: float, decimals: int|None=None) -> str:
     if decimals is None:
-        s = f"{x:,.0f}"
-    else:
-        s = f"{x:,.{decimals}f}"
-    # Use Albanian style: '.' thousands and ',' decimals is common in EU, but the UI previously used sq-AL.
-    # Keep simple: replace ',' with space to avoid locale; or leave English. We'll keep English grouping.
-    return s
+        return _fmt0(x)
+    if decimals == 2:
+        return _fmt2(x)
+    return format(x, f",.{decimals}f")
+
+# Worker table row: ID, Emri, Paga Bruto, Sigurime Punonjës, TAP, Paga Neto (same formats as _fmt0/_fmt2)
+_ROW_TMPL = "<tr><td>{}</td><td>{}</td><td>{:,.0f}</td><td>{:,.2f}</td><td>{:,.0f}</td><td>{:,.2f}</td></tr>"
+
+# Person fields the kernel reads, in the column order of the matrix built by _compute
+_KERNEL_FIELDS = (
+    "pagaBruto", "tap", "pensionVullnetar",
+    "kontrShoqDhenes", "kontrSuplDhenes", "kontrShoqMarres", "kontrSuplMarres",
+    "kontrShoqTotal", "kontrSuplTotal", "kontrShendetTotal",
+)
+_get_kernel_fields = attrgetter(*_KERNEL_FIELDS)
+
+def _compute(people: list[Person]) -> tuple[np.ndarray, ...]:
+    # Shared per-person kernel for both analyzers; returns float64 columns
+    # (pagaBruto, tap, komp_total, pun_total, paga_neto, detyrime431)
+    # All fields are pulled in one C-level pass into an (n, 10) matrix; the columns below are views into it.
+    matrix = np.array(list(map(_get_kernel_fields, people)), dtype=np.float64).reshape(len(people), len(_KERNEL_FIELDS))
+    (pagaBruto, tap, pensionVullnetar,
+     kontrShoqDhenes, kontrSuplDhenes, kontrShoqMarres, kontrSuplMarres,
+     kontrShoqTotal, kontrSuplTotal, kontrShendetTotal) = matrix.T
+    shendet_ndarje = kontrShendetTotal / 2.0
+    komp_shoq = kontrShoqDhenes + kontrSuplDhenes
+    komp_shendet = shendet_ndarje
+    pun_shoq = kontrShoqMarres + kontrSuplMarres
+    pun_shendet = shendet_ndarje
+    paga_neto = pagaBruto - pun_shoq - pun_shendet - tap - pensionVullnetar
+    komp_total = komp_shoq + komp_shendet
+    pun_total = pun_shoq + pun_shendet
+    detyrime431 = kontrShoqTotal + kontrSuplTotal + kontrShendetTotal
+    return pagaBruto, tap, komp_total, pun_total, paga_neto, detyrime431
+
+def _total(col: np.ndarray) -> float:
+    # Strict left-to-right float addition, as the old per-row `total += x` loops did. Half-cent values
+    # (kontrShendetTotal / 2) put many totals on a rounding tie, so pairwise (np.sum) or compensated
+    # (math.fsum) summation would move ~20% of displayed totals by a cent.
+    return reduce(add, col.tolist(), 0.0)
+
+def _tabulate(people: list[Person], komp_total: np.ndarray, pun_total: np.ndarray, paga_neto: np.ndarray) -> tuple[list[dict], list[dict], list[str]]:
+    bankData, fullData, rows = [], [], []
+    add_bank, add_full, add_row, fmt_row = bankData.append, fullData.append, rows.append, _ROW_TMPL.format
+    for p, komp, pun, neto in zip(people, komp_total.tolist(), pun_total.tolist(), paga_neto.tolist()):
+        # Builtin round, not np.round: np.round(x, 2) rounds x*100 and disagrees with the ',.2f' table
+        # formatting on ~18% of half-cent values (kontrShendetTotal / 2), so bank amounts would drift by a cent
+        neto_r = round(neto,2)
+        add_bank({"Emri / Mbiemri": p.emri, "Paga Neto": neto_r})
+        add_full({
+            "ID": p.id, "Emri": p.emri, "Paga Bruto": p.pagaBruto,
+            "Sig_Kompania": round(komp,2),
+            "Sig_Punonjesi": round(pun,2),
+            "TAP": p.tap, "Paga Neto": neto_r
+        })
+        add_row(fmt_row(p.id, p.emri, p.pagaBruto, pun, p.tap, neto))
+    return bankData, fullData, rows
 
 def analyze_pf(meta: Meta, people: list[Person], selected_idx: int|None) -> AnalyzeOut:
     if selected_idx is None or selected_idx < 0 or selected_idx >= len(people):
@@ -152,36 +263,14 @@ def analyze_pf(meta: Meta, people: list[Person], selected_idx: int|None) -> Anal
     owner = people[selected_idx]
     workers = [p for i,p in enumerate(people) if i != selected_idx]
 
-    totalPagaBrutoPun = 0.0
-    totalKontrKompPun = 0.0
-    totalTAPPun = 0.0
-    totalPagaNetoPun = 0.0
-    totalDetyrime431Pun = 0.0
-    bankData, fullData = [], []
-
-    rows = []
-    for p in workers:
-        shendet_ndarje = p.kontrShendetTotal / 2.0
-        komp_shoq = p.kontrShoqDhenes + p.kontrSuplDhenes
-        komp_shendet = shendet_ndarje
-        pun_shoq = p.kontrShoqMarres + p.kontrSuplMarres
-        pun_shendet = shendet_ndarje
-        paga_neto = p.pagaBruto - pun_shoq - pun_shendet - p.tap - p.pensionVullnetar
-
-        totalPagaBrutoPun += p.pagaBruto
-        totalKontrKompPun += komp_shoq + komp_shendet
-        totalTAPPun += p.tap
-        totalPagaNetoPun += paga_neto
-        totalDetyrime431Pun += p.kontrShoqTotal + p.kontrSuplTotal + p.kontrShendetTotal
-
-        bankData.append({"Emri / Mbiemri": p.emri, "Paga Neto": round(paga_neto,2)})
-        fullData.append({
-            "ID": p.id, "Emri": p.emri, "Paga Bruto": p.pagaBruto,
-            "Sig_Kompania": round(komp_shoq + komp_shendet,2),
-            "Sig_Punonjesi": round(pun_shoq + pun_shendet,2),
-            "TAP": p.tap, "Paga Neto": round(paga_neto,2)
-        })
-        rows.append(f"<tr><td>{p.id}</td><td>{p.emri}</td><td>{fmt_num(p.pagaBruto)}</td><td>{fmt_num(pun_shoq + pun_shendet,2)}</td><td>{fmt_num(p.tap)}</td><td>{fmt_num(paga_neto,2)}</td></tr>")
+    pagaBruto, tap, komp_total, pun_total, paga_neto, detyrime431 = _compute(workers)
+
+    totalPagaBrutoPun = _total(pagaBruto)
+    totalKontrKompPun = _total(komp_total)
+    totalTAPPun = _total(tap)
+    totalPagaNetoPun = _total(paga_neto)
+    totalDetyrime431Pun = _total(detyrime431)
+    bankData, fullData, rows = _tabulate(workers, komp_total, pun_total, paga_neto)
 
     kostoSigPF = owner.kontrShoqTotal + owner.kontrSuplTotal + owner.kontrShendetTotal
     totalShpenzimPage = totalPagaBrutoPun
@@ -197,20 +286,20 @@ def analyze_pf(meta: Meta, people: list[Person], selected_idx: int|None) -> Anal
     <div class="table-wrapper"><table>
     <thead><tr><th>Llogaria</th><th>Kodi</th><th>Debit</th><th>Kredit</th></tr></thead>
     <tbody>
-    <tr><td>Shpenzime Page (Punonjësit)</td><td>641</td><td>{fmt_num(totalShpenzimPage)}</td><td></td></tr>
-    <tr><td>Shpenzime Sigurimesh (Biznesi)</td><td>644</td><td>{fmt_num(totalShpenzimSig,2)}</td><td></td></tr>
-    <tr><td>Detyrime ndaj Personelit (Neto)</td><td>421</td><td></td><td>{fmt_num(totalDetyrimePersonel,2)}</td></tr>
-    <tr><td>Detyrime për Sigurimet</td><td>431</td><td></td><td>{fmt_num(totalDetyrimeSig,2)}</td></tr>
-    <tr><td>Detyrime për TAP</td><td>442</td><td></td><td>{fmt_num(totalDetyrimeTAP)}</td></tr>
+    <tr><td>Shpenzime Page (Punonjësit)</td><td>641</td><td>{_fmt0(totalShpenzimPage)}</td><td></td></tr>
+    <tr><td>Shpenzime Sigurimesh (Biznesi)</td><td>644</td><td>{_fmt2(totalShpenzimSig)}</td><td></td></tr>
+    <tr><td>Detyrime ndaj Personelit (Neto)</td><td>421</td><td></td><td>{_fmt2(totalDetyrimePersonel)}</td></tr>
+    <tr><td>Detyrime për Sigurimet</td><td>431</td><td></td><td>{_fmt2(totalDetyrimeSig)}</td></tr>
+    <tr><td>Detyrime për TAP</td><td>442</td><td></td><td>{_fmt0(totalDetyrimeTAP)}</td></tr>
     </tbody>
-    <tfoot><tr><td colspan="2">TOTALI</td><td>{fmt_num(totalDebit,2)}</td><td>{fmt_num(totalKredit,2)}</td></tr></tfoot>
+    <tfoot><tr><td colspan="2">TOTALI</td><td>{_fmt2(totalDebit)}</td><td>{_fmt2(totalKredit)}</td></tr></tfoot>
     </table></div>
     """
     ownerHTML = f"""
     <h3 class="section-title">Detajet për Pronarin</h3>
     <div class="table-wrapper"><table>
     <thead><tr><th>ID</th><th>Emri</th><th>Paga Bruto (Referencë)</th><th>Kosto Totale Sigurimesh</th></tr></thead>
-    <tbody><tr><td>{owner.id}</td><td>{owner.emri}</td><td>{fmt_num(owner.pagaBruto)}</td><td>{fmt_num(kostoSigPF,2)}</td></tr></tbody>
+    <tbody><tr><td>{owner.id}</td><td>{owner.emri}</td><td>{_fmt0(owner.pagaBruto)}</td><td>{_fmt2(kostoSigPF)}</td></tr></tbody>
     </table></div>
     """
     workersHTML = ""
@@ -232,35 +321,14 @@ def analyze_pf(meta: Meta, people: list[Person], selected_idx: int|None) -> Anal
     )
 
 def analyze_shpk(meta: Meta, people: list[Person]) -> AnalyzeOut:
-    totalPagaBruto = 0.0
-    totalKontrKomp = 0.0
-    totalTAP = 0.0
-    totalPagaNeto = 0.0
-    totalDetyrime431 = 0.0
-    bankData, fullData = [], []
-    rows = []
-    for p in people:
-        shendet_ndarje = p.kontrShendetTotal / 2.0
-        komp_shoq = p.kontrShoqDhenes + p.kontrSuplDhenes
-        komp_shendet = shendet_ndarje
-        pun_shoq = p.kontrShoqMarres + p.kontrSuplMarres
-        pun_shendet = shendet_ndarje
-        paga_neto = p.pagaBruto - pun_shoq - pun_shendet - p.tap - p.pensionVullnetar
-
-        totalPagaBruto += p.pagaBruto
-        totalKontrKomp += komp_shoq + komp_shendet
-        totalTAP += p.tap
-        totalPagaNeto += paga_neto
-        totalDetyrime431 += p.kontrShoqTotal + p.kontrSuplTotal + p.kontrShendetTotal
-
-        bankData.append({"Emri / Mbiemri": p.emri, "Paga Neto": round(paga_neto,2)})
-        fullData.append({
-            "ID": p.id, "Emri": p.emri, "Paga Bruto": p.pagaBruto,
-            "Sig_Kompania": round(komp_shoq + komp_shendet,2),
-            "Sig_Punonjesi": round(pun_shoq + pun_shendet,2),
-            "TAP": p.tap, "Paga Neto": round(paga_neto,2)
-        })
-        rows.append(f"<tr><td>{p.id}</td><td>{p.emri}</td><td>{fmt_num(p.pagaBruto)}</td><td>{fmt_num(pun_shoq + pun_shendet,2)}</td><td>{fmt_num(p.tap)}</td><td>{fmt_num(paga_neto,2)}</td></tr>")
+    pagaBruto, tap, komp_total, pun_total, paga_neto, detyrime431 = _compute(people)
+
+    totalPagaBruto = _total(pagaBruto)
+    totalKontrKomp = _total(komp_total)
+    totalTAP = _total(tap)
+    totalPagaNeto = _total(paga_neto)
+    totalDetyrime431 = _total(detyrime431)
+    bankData, fullData, rows = _tabulate(people, komp_total, pun_total, paga_neto)
 
     totalDebit = totalPagaBruto + totalKontrKomp
     totalKredit = totalPagaNeto + totalDetyrime431 + totalTAP
@@ -270,13 +338,13 @@ def analyze_shpk(meta: Meta, people: list[Person]) -> AnalyzeOut:
     <div class="table-wrapper"><table>
     <thead><tr><th>Llogaria</th><th>Kodi</th><th>Debit</th><th>Kredit</th></tr></thead>
     <tbody>
-    <tr><td>Shpenzime Page</td><td>641</td><td>{fmt_num(totalPagaBruto)}</td><td></td></tr>
-    <tr><td>Shpenzime Sigurimesh</td><td>644</td><td>{fmt_num(totalKontrKomp,2)}</td><td></td></tr>
-    <tr><td>Detyrime ndaj Personelit (Neto)</td><td>421</td><td></td><td>{fmt_num(totalPagaNeto,2)}</td></tr>
-    <tr><td>Detyrime për Sigurimet</td><td>431</td><td></td><td>{fmt_num(totalDetyrime431,2)}</td></tr>
-    <tr><td>Detyrime për TAP</td><td>442</td><td></td><td>{fmt_num(totalTAP)}</td></tr>
+    <tr><td>Shpenzime Page</td><td>641</td><td>{_fmt0(totalPagaBruto)}</td><td></td></tr>
+    <tr><td>Shpenzime Sigurimesh</td><td>644</td><td>{_fmt2(totalKontrKomp)}</td><td></td></tr>
+    <tr><td>Detyrime ndaj Personelit (Neto)</td><td>421</td><td></td><td>{_fmt2(totalPagaNeto)}</td></tr>
+    <tr><td>Detyrime për Sigurimet</td><td>431</td><td></td><td>{_fmt2(totalDetyrime431)}</td></tr>
+    <tr><td>Detyrime për TAP</td><td>442</td><td></td><td>{_fmt0(totalTAP)}</td></tr>
     </tbody>
-    <tfoot><tr><td colspan="2">TOTALI</td><td>{fmt_num(totalDebit,2)}</td><td>{fmt_num(totalKredit,2)}</td></tr></tfoot>
+    <tfoot><tr><td colspan="2">TOTALI</td><td>{_fmt2(totalDebit)}</td><td>{_fmt2(totalKredit)}</td></tr></tfoot>
     </table></div>
     """
     workersHTML = f"""
@@ -296,14 +364,47 @@ def analyze_shpk(meta: Meta, people: list[Person]) -> AnalyzeOut:
     )
 
 # ----------------- Endpoints -----------------
-@app.post("/api/parse", response_model=ParseOut)
+# Responses are dumped once and encoded with orjson; response_model is kept for the OpenAPI schema
+@app.post("/api/parse", response_model=ParseOut, response_class=ORJSONResponse)
 async def api_parse(inp: ParseIn):
     meta, people = parse_text(inp.text or "")
-    return ParseOut(meta=meta, people=people)
+    return ORJSONResponse(ParseOut(meta=meta, people=people).model_dump())
 
-@app.post("/api/analyze", response_model=AnalyzeOut)
-async def api_analyze(inp: AnalyzeIn):
+# Identical analyze requests (e.g. the user re-opening a view) are served from a small
+# process-local LRU of the encoded response, keyed on the validated request's JSON dump.
+# Only payrolls up to _ANALYZE_CACHE_MAX_PEOPLE are cached, to bound memory.
+_ANALYZE_CACHE_MAX_PEOPLE = 500
+_ANALYZE_CACHE_MAX_ENTRIES = 64
+_analyze_cache: OrderedDict[tuple[str, int], bytes] = OrderedDict()
+
+def _analyze_json(inp: AnalyzeIn, selected_idx: int) -> bytes:
     if inp.type == "PF":
-        return analyze_pf(inp.meta, inp.people, inp.selectedIndex if inp.selectedIndex is not None else 0)
+        out = analyze_pf(inp.meta, inp.people, selected_idx)
+    else:
+        out = analyze_shpk(inp.meta, inp.people)
+    return orjson.dumps(out.model_dump())
+
+def _analyze_json_cached(inp: AnalyzeIn, selected_idx: int) -> bytes:
+    dump = inp.model_dump_json(exclude={"selectedIndex", "adminIndex"})
+    # NaN/Infinity/overflowing floats all dump as null, so such keys are not exact; don't cache them
+    if ":null" in dump:
+        return _analyze_json(inp, selected_idx)
+    key = (dump, selected_idx)
+    body = _analyze_cache.get(key)
+    if body is not None:
+        _analyze_cache.move_to_end(key)
+        return body
+    body = _analyze_cache[key] = _analyze_json(inp, selected_idx)
+    if len(_analyze_cache) > _ANALYZE_CACHE_MAX_ENTRIES:
+        _analyze_cache.popitem(last=False)
+    return body
+
+@app.post("/api/analyze", response_model=AnalyzeOut, response_class=ORJSONResponse)
+async def api_analyze(inp: AnalyzeIn):
+    # selectedIndex only matters for PF; normalizing it for SHPK lets those requests share a cache entry
+    selected_idx = inp.selectedIndex if inp.type == "PF" and inp.selectedIndex is not None else 0
+    if len(inp.people) > _ANALYZE_CACHE_MAX_PEOPLE:
+        body = _analyze_json(inp, selected_idx)
     else:
-        return analyze_shpk(inp.meta, inp.people)
+        body = _analyze_json_cached(inp, selected_idx)
+    return Response(body, media_type="application/json")